@@ -0,0 +1,80 @@
+"""
+Cold start benchmark for prometheusrock.
+
+Measures time of `import prometheusrock`, time of building Starlette app
+with `PrometheusMiddleware` and `AddMetric`, and both of them together (cold start).
+Starlette itself is imported before timer starts, since it is needed by app anyway.
+Every sample runs in a fresh interpreter, so module caches don't affect results.
+
+To compare with another version, check it out and pass its root with `--path`:
+    git worktree add /tmp/prometheusrock-old <commit>
+    python benchmarks/startup.py --path /tmp/prometheusrock-old
+
+Usage:
+    python benchmarks/startup.py [--runs 20] [--path PATH]
+
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP_CODE = """
+import time
+from starlette.applications import Starlette
+
+def function(middleware_proxy):
+    middleware_proxy.metric.labels('info').inc()
+"""
+
+IMPORT_CODE = """
+import prometheusrock
+"""
+
+CONSTRUCTION_CODE = """
+from prometheusrock import PrometheusMiddleware, AddMetric, metrics_route
+
+app = Starlette()
+app.add_middleware(PrometheusMiddleware, app_name='BenchApp')
+app.add_route('/metrics', metrics_route)
+AddMetric(function=function, metric_name='bench_metric', metric_type='counter')
+"""
+
+CASES = (
+    ("import", "", IMPORT_CODE),
+    ("construction", IMPORT_CODE, CONSTRUCTION_CODE),
+    ("cold start", "", IMPORT_CODE + CONSTRUCTION_CODE),
+)
+
+
+def build_script(prepare: str, timed: str) -> str:
+    return (SETUP_CODE + prepare
+            + "begin = time.perf_counter()\n" + timed
+            + "print(time.perf_counter() - begin)\n")
+
+
+def measure(code: str, runs: int, path: str) -> list:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=path)
+        samples.append(float(output.decode().strip()))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="prometheusrock cold start benchmark")
+    parser.add_argument("--runs", type=int, default=20, help="number of fresh interpreters per case")
+    parser.add_argument("--path", default=ROOT, help="root of prometheusrock checkout to benchmark")
+    args = parser.parse_args()
+
+    for name, prepare, timed in CASES:
+        samples = measure(build_script(prepare, timed), args.runs, args.path)
+        print(f"{name:<14} median {statistics.median(samples) * 1000:8.2f} ms"
+              f"   min {min(samples) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
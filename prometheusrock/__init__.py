@@ -1,3 +1,32 @@
-from prometheusrock.route import metrics_route
-from prometheusrock.middleware import PrometheusMiddleware, MetricsStorage
-from prometheusrock.add_custom_metric import AddMetric, Metric
+import sys
+
+# Submodules pull in starlette and prometheus_client, so they are only
+# imported when one of the public names is actually accessed.
+_lazy_imports = {
+    'metrics_route': 'prometheusrock.route',
+    'PrometheusMiddleware': 'prometheusrock.middleware',
+    'MetricsStorage': 'prometheusrock.middleware',
+    'AddMetric': 'prometheusrock.add_custom_metric',
+    'Metric': 'prometheusrock.add_custom_metric',
+}
+
+__all__ = list(_lazy_imports)
+
+if sys.version_info >= (3, 7):
+    import importlib
+
+    def __getattr__(name):
+        module_name = _lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(list(globals()) + __all__)
+else:
+    # Module level __getattr__ is not supported before Python 3.7
+    from prometheusrock.route import metrics_route
+    from prometheusrock.middleware import PrometheusMiddleware, MetricsStorage
+    from prometheusrock.add_custom_metric import AddMetric, Metric
@@ -1,20 +1,14 @@
-from typing import List
+from typing import List, TYPE_CHECKING
 
-from prometheus_client import (
-    Counter,
-    Histogram,
-    Summary,
-    Gauge,
-    Info,
-    Enum
-)
+if TYPE_CHECKING:
+    from prometheus_client import Counter
 
 from prometheusrock.middleware import MetricsStorage
 from prometheusrock.singleton import SingletonMeta
 
 
 class Metric:
-    def __init__(self, metric: Counter, function: object, metric_type: str, spent_time: float = 0):
+    def __init__(self, metric: 'Counter', function: object, metric_type: str, spent_time: float = 0):
         """
         Storage of metric properties
 
@@ -90,6 +84,15 @@ class AddMetric:
             )
 
         def _metric_constructor(self, params: '_ParamStorage'):
+            from prometheus_client import (
+                Counter,
+                Histogram,
+                Summary,
+                Gauge,
+                Info,
+                Enum
+            )
+
             types = {
                 'counter': Counter,
                 'histogram': Histogram,
@@ -106,10 +109,17 @@ class AddMetric:
                     metric = types[params.metric_type.lower()](
                         params.metric_name,
                         params.metric_description,
-                        params.labels
+                        params.labels,
+                        registry=None
                     )
-                except ValueError:
-                    raise ValueError(f"You already registered metric with name {params.metric_name}!")
+                except ValueError as e:
+                    raise ValueError(f"Invalid metric {params.metric_name}: {e}") from e
+
+                try:
+                    # metric is registered in default registry on first request, see MetricsStorage.register
+                    metric_pool.reserve(metric)
+                except ValueError as e:
+                    raise ValueError(f"Metric with name {params.metric_name} is already registered! {e}") from e
             else:
                 raise TypeError("""Invalid metric type! Choose of the following metric types:
                         1. counter
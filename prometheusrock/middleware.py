@@ -1,18 +1,16 @@
 import time
 import inspect
+import logging
 from typing import List, Tuple
 
-from prometheus_client import (
-    Counter,
-    Histogram,
-    Gauge
-)
 from starlette import status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from prometheusrock.singleton import SingletonMeta
 
+logger = logging.getLogger(__name__)
+
 
 class MetricsStorage(metaclass=SingletonMeta):
     def __init__(self,
@@ -20,22 +18,101 @@ class MetricsStorage(metaclass=SingletonMeta):
                  disable_default_counter: bool = False,
                  disable_default_histogram: bool = False
                  ):
+        from prometheus_client import Counter, Histogram, CollectorRegistry
+
         self.labels = labels
+        self.custom_metrics = []
+        self._unregistered = []
+        self._failed = []
+        # holds every metric of this library, so they can't collide with each other
+        self._reserved = CollectorRegistry()
+
+        self._request_count = None
         if not disable_default_counter:
-            self.REQUEST_COUNT = Counter(
+            self._request_count = self.reserve(Counter(
                 "requests_total",
                 "Total HTTP requests",
                 labels,
-            )
+                registry=None
+            ))
 
+        self._request_time = None
         if not disable_default_histogram:
-            self.REQUEST_TIME = Histogram(
+            self._request_time = self.reserve(Histogram(
                 "request_processing_time",
                 "HTTP request processing time in seconds",
                 labels,
-            )
+                registry=None
+            ))
 
-        self.custom_metrics = []
+    def reserve(self, metric):
+        """
+        Check that names of metric are free and postpone its registration in default registry till first use.
+
+        Args:
+            metric: `prometheus_client` metric created with `registry=None`
+
+        Raises:
+            ValueError: if metric names are already taken by registered or reserved collector
+
+        """
+        from prometheus_client import REGISTRY
+
+        # trial registration is the only public way to check names against default registry
+        REGISTRY.register(metric)
+        REGISTRY.unregister(metric)
+        self._reserved.register(metric)
+
+        self._unregistered.append(metric)
+        return metric
+
+    def register(self, metric) -> bool:
+        """
+        Register reserved metric in default registry. Does nothing if metric is already registered.
+        If names were taken by other collector after reservation, logs warning (once per metric)
+        and tries again on next call, so metric is missing from `/metrics` till conflict is resolved.
+
+        Returns:
+            bool: True if metric is registered
+
+        """
+        if metric not in self._unregistered:
+            return True
+
+        from prometheus_client import REGISTRY
+
+        try:
+            REGISTRY.register(metric)
+        except ValueError as e:
+            if metric not in self._failed:
+                self._failed.append(metric)
+                logger.warning("Can't register metric %s: %s", metric.describe()[0].name, e)
+            return False
+
+        self._unregistered.remove(metric)
+        return True
+
+    @property
+    def REQUEST_COUNT(self):
+        """
+        Default counter. Registered on first access, `hasattr` check returns False if it's disabled.
+
+        """
+        if self._request_count is None:
+            raise AttributeError("Default counter is disabled")
+        self.register(self._request_count)
+        return self._request_count
+
+    @property
+    def REQUEST_TIME(self):
+        """
+        Default histogram. Registered on first access, `hasattr` check returns False if it's disabled.
+
+        """
+        if self._request_time is None:
+            raise AttributeError("Default histogram is disabled")
+        self.register(self._request_time)
+        return self._request_time
 
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
@@ -155,6 +232,7 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
                     self.metrics.REQUEST_TIME.labels(**final_labels).observe(spent_time)
 
                 for metric_key in self.metrics.custom_metrics:
+                    self.metrics.register(metric_key.metric)
                     metric_key.spent_time = spent_time
                     metric_key.request = request
                     if inspect.iscoroutinefunction(metric_key.function):
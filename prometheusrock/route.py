@@ -1,16 +1,37 @@
 import os
+from threading import Lock
 
 from prometheus_client import (
     generate_latest,
     CONTENT_TYPE_LATEST,
     REGISTRY,
-    multiprocess,
     CollectorRegistry
 )
 from starlette import status
 from starlette.requests import Request
 from starlette.responses import Response
 
+_multiprocess_registry = None
+_multiprocess_registry_lock = Lock()
+
+
+def _get_multiprocess_registry() -> CollectorRegistry:
+    """
+    Build registry with multiprocess collector on first call and reuse it afterwards.
+    Collector reads metric files on every collect, so there is no need to recreate it per request.
+    Sync endpoints are run in threadpool, so creation is guarded by lock.
+
+    """
+    global _multiprocess_registry
+    with _multiprocess_registry_lock:
+        if _multiprocess_registry is None:
+            from prometheus_client import multiprocess
+
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            _multiprocess_registry = registry
+        return _multiprocess_registry
+
 
 def metrics_route(request: Request):
     """
@@ -24,8 +45,7 @@ def metrics_route(request: Request):
     """
     registry = REGISTRY
     if 'prometheus_multiproc_dir' in os.environ:
-        registry = CollectorRegistry()
-        multiprocess.MultiProcessCollector(registry)
+        registry = _get_multiprocess_registry()
 
     data = generate_latest(registry)
     response_headers = {
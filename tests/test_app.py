@@ -1,8 +1,15 @@
+import os
+import subprocess
+import sys
+
 import pytest
 from async_asgi_testclient import TestClient
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, generate_latest, multiprocess
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
 from starlette.applications import Starlette
 
-from prometheusrock import PrometheusMiddleware
+from prometheusrock import PrometheusMiddleware, MetricsStorage, metrics_route
+from prometheusrock import route
 
 
 class TestAppWithSimpleRequests:
@@ -149,5 +156,80 @@ class TestCustomPathsAndHeaders:
             assert """requests_total{headers="{'x-api-client': 'test'}",method="GET",path="/custom/",status_code="200"} 2.0""" in metrics
 
 
-
-
+class TestLazyInitialization:
+    @pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7")
+    def test_lazy_import(self):
+        code = "import sys, prometheusrock; print('prometheus_client' in sys.modules, 'starlette' in sys.modules)"
+        result = subprocess.check_output(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        assert result.decode().strip() == "False False"
+
+    def test_default_metrics_registered_on_first_use(self):
+        MetricsStorage.clear()
+        metrics = MetricsStorage(["method"], disable_default_histogram=True)
+        try:
+            assert "requests_total" not in generate_latest().decode()
+            assert not hasattr(metrics, "REQUEST_TIME")
+
+            metrics.REQUEST_COUNT.labels(method="GET").inc()
+            assert """requests_total{method="GET"} 1.0""" in generate_latest().decode()
+        finally:
+            REGISTRY.unregister(metrics.REQUEST_COUNT)
+            MetricsStorage.clear()
+
+    def test_failed_registration_is_retried(self, caplog):
+        MetricsStorage.clear()
+        metrics = MetricsStorage(["method"], disable_default_histogram=True)
+        external = Counter("requests_total", "taken after reservation", ["method"])
+        try:
+            counter = metrics.REQUEST_COUNT
+            counter.labels(method="GET").inc()
+            metrics.REQUEST_COUNT
+            assert len([record for record in caplog.records if "requests_total" in record.message]) == 1
+            assert not metrics.register(counter)
+
+            REGISTRY.unregister(external)
+            assert metrics.REQUEST_COUNT is counter
+            assert """requests_total{method="GET"} 1.0""" in generate_latest().decode()
+        finally:
+            REGISTRY.unregister(metrics.REQUEST_COUNT)
+            MetricsStorage.clear()
+
+
+class TestMultiprocessRoute:
+    @pytest.fixture
+    def multiproc_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("prometheus_multiproc_dir", str(tmp_path))
+        monkeypatch.setattr(route, "_multiprocess_registry", None)
+
+        values = MmapedDict(str(tmp_path / "counter_1.db"))
+        values.write_value(mmap_key("mp_metric", "mp_metric_total", ["method"], ["GET"]), 3.0)
+        values.close()
+
+        yield tmp_path
+
+    def test_registry_not_created_without_env(self, monkeypatch):
+        monkeypatch.delenv("prometheus_multiproc_dir", raising=False)
+        monkeypatch.setattr(route, "_multiprocess_registry", None)
+
+        metrics_route(None)
+        assert route._multiprocess_registry is None
+
+    def test_registry_reused(self, multiproc_dir):
+        first = metrics_route(None)
+        registry = route._multiprocess_registry
+        assert registry is not None
+
+        second = metrics_route(None)
+        assert route._multiprocess_registry is registry
+        assert first.body == second.body
+
+    def test_same_output_as_per_request_registry(self, multiproc_dir):
+        expected = CollectorRegistry()
+        multiprocess.MultiProcessCollector(expected)
+
+        body = metrics_route(None).body
+        assert body == generate_latest(expected)
+        assert b"""mp_metric_total{method="GET"} 3.0""" in body
@@ -1,5 +1,6 @@
 import pytest
 from async_asgi_testclient import TestClient
+from prometheus_client import REGISTRY, Counter, generate_latest
 
 from prometheusrock import MetricsStorage, AddMetric
 
@@ -10,6 +11,10 @@ async def function(middleware_proxy: MetricsStorage):
     middleware_proxy.metric.labels(res)
 
 
+def path_counter(middleware_proxy: MetricsStorage):
+    middleware_proxy.metric.labels(middleware_proxy.request.url.path).inc()
+
+
 class TestCustomMetrics:
     @pytest.mark.asyncio
     async def test_custom_info(self, app_with_middleware):
@@ -48,3 +53,55 @@ class TestCustomMetrics:
                 metric_type='info',
                 metric_description='custom description'
             )
+
+    @pytest.mark.asyncio
+    async def test_custom_registered_on_first_request(self, app_with_middleware):
+        AddMetric(
+            function=path_counter,
+            metric_name='lazy_metric',
+            metric_type='counter',
+            labels=['path']
+        )
+        assert "lazy_metric" not in generate_latest().decode()
+
+        async with TestClient(application=app_with_middleware) as client:
+            await client.get("/200")
+            metrics = (await client.get("/metrics_route")).content.decode()
+            assert """lazy_metric_total{path="/200"} 1.0""" in metrics
+
+
+class TestCustomMetricCollisions:
+    @pytest.fixture
+    def metrics_storage(self):
+        MetricsStorage.clear()
+        # reserves, but doesn't register yet, requests_total and request_processing_time
+        yield MetricsStorage(["method"])
+        MetricsStorage.clear()
+
+    def test_collision_with_external_collector(self, metrics_storage):
+        external = Counter('ext_metric', 'metric registered outside of prometheusrock')
+        try:
+            with pytest.raises(ValueError, match="already registered"):
+                AddMetric(
+                    function=path_counter,
+                    metric_name='ext_metric',
+                    metric_type='counter'
+                )
+        finally:
+            REGISTRY.unregister(external)
+
+    def test_collision_with_reserved_default_metric(self, metrics_storage):
+        with pytest.raises(ValueError, match="already registered"):
+            AddMetric(
+                function=path_counter,
+                metric_name='requests',
+                metric_type='counter'
+            )
+
+    def test_invalid_metric_name(self, metrics_storage):
+        with pytest.raises(ValueError, match="Invalid metric"):
+            AddMetric(
+                function=path_counter,
+                metric_name='invalid name',
+                metric_type='counter'
+            )